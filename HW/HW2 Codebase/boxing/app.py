@@ -523,6 +523,10 @@ if __name__ == '__main__':
     app.logger.info("Starting Flask app...")
 
     try:
+        # Bring databases persisted from older schemas (CREATE_DB=false) up to date
+        boxers_model.migrate_weight_class()
+        app.logger.info("Database schema is up to date.")
+
         app.run(debug=True, host='0.0.0.0', port=5000)
     except Exception as e:
         app.logger.error(f"Flask app encountered an error: {e}")
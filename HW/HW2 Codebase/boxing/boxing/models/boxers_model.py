@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 import logging
 import sqlite3
+import time
 from typing import Any, List
 
 from boxing.utils.sql_utils import get_db_connection
@@ -11,18 +13,101 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
-@dataclass
-class Boxer:
+# Minimum weight of each class; bisect_right over the thresholds indexes
+# straight into the names (index 0 means below the lightest class)
+_WEIGHT_CLASS_THRESHOLDS = (125, 133, 166, 203)
+_WEIGHT_CLASS_NAMES = (None, 'FEATHERWEIGHT', 'LIGHTWEIGHT', 'MIDDLEWEIGHT', 'HEAVYWEIGHT')
+
+
+# Queries are kept as module-level constants so every call passes the same
+# string and hits the connection's prepared statement cache. The by-id/by-name
+# column order matches the Boxer fields so rows unpack straight into Boxer(*row)
+_Q_INSERT_BOXER = """
+    INSERT INTO boxers (name, weight, height, reach, age, weight_class)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_Q_DELETE_BOXER = "DELETE FROM boxers WHERE id = ?"
+_Q_SELECT_BY_ID = """
+    SELECT id, name, weight, height, reach, age
+    FROM boxers WHERE id = ?
+"""
+_Q_SELECT_BY_NAME = """
+    SELECT id, name, weight, height, reach, age
+    FROM boxers WHERE name = ?
+"""
+_Q_UPDATE_BY_RESULT = {
+    'win': "UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?",
+    'loss': "UPDATE boxers SET fights = fights + 1 WHERE id = ?",
+}
+_Q_APPLY_FIGHT_RESULT = "UPDATE boxers SET fights = fights + 1, wins = wins + ? WHERE id = ?"
+
+# One-time upgrade of databases created before boxers.weight_class existed
+_Q_TABLE_COLUMNS = "PRAGMA table_info(boxers)"
+_Q_ADD_WEIGHT_CLASS = "ALTER TABLE boxers ADD COLUMN weight_class TEXT"
+_Q_SELECT_MISSING_WEIGHT_CLASS = "SELECT id, weight FROM boxers WHERE weight_class IS NULL"
+_Q_SET_WEIGHT_CLASS = "UPDATE boxers SET weight_class = ? WHERE id = ?"
+
+# SQLite's ROUND() rounds halves away from zero, unlike Python's round() on the
+# binary float, so e.g. 1 win in 16 fights reports 6.3 (round(6.25, 1) is 6.2)
+_Q_LEADERBOARD = """
+    SELECT id, name, weight, height, reach, age, weight_class, fights, wins,
+           ROUND(wins * 100.0 / fights, 1) AS win_pct
+    FROM boxers
+    WHERE fights > 0
+"""
+# win_pct orders by the raw ratio so the idx_boxers_win_pct expression index applies
+_Q_LEADERBOARD_BY_SORT = {
+    'wins': _Q_LEADERBOARD + " ORDER BY wins DESC",
+    'win_pct': _Q_LEADERBOARD + " ORDER BY (wins * 1.0 / fights) DESC",
+}
+
+
+# Leaderboards are cached per sort_by for a short window. Every committed write
+# to the boxers table bumps _LB_VERSION, which invalidates all cached entries
+LEADERBOARD_CACHE_TTL = 5.0
+_LB_CACHE: dict[str, tuple[int, float, List[dict[str, Any]]]] = {}
+_LB_VERSION = 0
+
+
+def _invalidate_leaderboard() -> None:
+    global _LB_VERSION
+    _LB_VERSION += 1
+
+
+def _clear_leaderboard_cache() -> None:
+    # Drops every cached leaderboard, e.g. between tests that mock the cursor
+    _LB_CACHE.clear()
+
+
+class _BoxerSlots:
+    # dataclass(slots=True) needs Python 3.10, so the slots live on a base class;
+    # this also keeps them clear of the field(init=False) placeholder below
+    __slots__ = ('id', 'name', 'weight', 'height', 'reach', 'age', 'weight_class')
+
+    # copy and pickle restore slots with setattr, which a frozen dataclass rejects,
+    # so round-trip the state explicitly (dataclass(slots=True) generates the same)
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in _BoxerSlots.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(_BoxerSlots.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class Boxer(_BoxerSlots):
+    __slots__ = ()
+
     id: int
     name: str
     weight: int
     height: int
     reach: float
     age: int
-    weight_class: str = None
+    weight_class: str = field(init=False)
 
     def __post_init__(self):
-        self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        object.__setattr__(self, 'weight_class', get_weight_class(self.weight))  # Automatically assign weight class
 
 
 def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
@@ -40,17 +125,11 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if the boxer already exists (name must be unique)
-            cursor.execute("SELECT 1 FROM boxers WHERE name = ?", (name,))
-            if cursor.fetchone():
-                raise ValueError(f"Boxer with name '{name}' already exists")
-
-            cursor.execute("""
-                INSERT INTO boxers (name, weight, height, reach, age)
-                VALUES (?, ?, ?, ?, ?)
-            """, (name, weight, height, reach, age))
+            # Duplicate names are rejected by the UNIQUE constraint on boxers.name
+            cursor.execute(_Q_INSERT_BOXER, (name, weight, height, reach, age, get_weight_class(weight)))
 
             conn.commit()
+            _invalidate_leaderboard()
 
     except sqlite3.IntegrityError:
         raise ValueError(f"Boxer with name '{name}' already exists")
@@ -64,55 +143,43 @@ def delete_boxer(boxer_id: int) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
+            cursor.execute(_Q_DELETE_BOXER, (boxer_id,))
+            if cursor.rowcount == 0:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
             conn.commit()
+            _invalidate_leaderboard()
 
     except sqlite3.Error as e:
         raise e
 
 
 def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
-    query = """
-        SELECT id, name, weight, height, reach, age, fights, wins,
-               (wins * 1.0 / fights) AS win_pct
-        FROM boxers
-        WHERE fights > 0
-    """
-
-    if sort_by == "win_pct":
-        query += " ORDER BY win_pct DESC"
-    elif sort_by == "wins":
-        query += " ORDER BY wins DESC"
-    else:
+    query = _Q_LEADERBOARD_BY_SORT.get(sort_by)
+    if query is None:
         raise ValueError(f"Invalid sort_by parameter: {sort_by}")
 
+    cached = _LB_CACHE.get(sort_by)
+    if cached is not None:
+        version, expiry, leaderboard = cached
+        if version == _LB_VERSION and time.monotonic() < expiry:
+            return [dict(row) for row in leaderboard]
+
+    # Capture the version before querying so a write that lands mid-query
+    # leaves this result marked stale
+    version = _LB_VERSION
+
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query)
-            rows = cursor.fetchall()
-
-        leaderboard = []
-        for row in rows:
-            boxer = {
-                'id': row[0],
-                'name': row[1],
-                'weight': row[2],
-                'height': row[3],
-                'reach': row[4],
-                'age': row[5],
-                'weight_class': get_weight_class(row[2]),  # Calculate weight class
-                'fights': row[6],
-                'wins': row[7],
-                'win_pct': round(row[8] * 100, 1)  # Convert to percentage
-            }
-            leaderboard.append(boxer)
-
-        return leaderboard
+            # Iterate the cursor directly rather than materializing fetchall() first
+            leaderboard = [dict(row) for row in cursor]
+
+        _LB_CACHE[sort_by] = (version, time.monotonic() + LEADERBOARD_CACHE_TTL, leaderboard)
+
+        # Hand out copies so callers can't modify the cached rows
+        return [dict(row) for row in leaderboard]
 
     except sqlite3.Error as e:
         raise e
@@ -122,19 +189,12 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE id = ?
-            """, (boxer_id,))
+            cursor.execute(_Q_SELECT_BY_ID, (boxer_id,))
 
             row = cursor.fetchone()
 
             if row:
-                boxer = Boxer(
-                    id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
-                )
-                return boxer
+                return Boxer(*row)
             else:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
@@ -146,19 +206,12 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, weight, height, reach, age
-                FROM boxers WHERE name = ?
-            """, (boxer_name,))
+            cursor.execute(_Q_SELECT_BY_NAME, (boxer_name,))
 
             row = cursor.fetchone()
 
             if row:
-                boxer = Boxer(
-                    id=row[0], name=row[1], weight=row[2], height=row[3],
-                    reach=row[4], age=row[5]
-                )
-                return boxer
+                return Boxer(*row)
             else:
                 raise ValueError(f"Boxer '{boxer_name}' not found.")
 
@@ -167,38 +220,74 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
 
 
 def get_weight_class(weight: int) -> str:
-    if weight >= 203:
-        weight_class = 'HEAVYWEIGHT'
-    elif weight >= 166:
-        weight_class = 'MIDDLEWEIGHT'
-    elif weight >= 133:
-        weight_class = 'LIGHTWEIGHT'
-    elif weight >= 125:
-        weight_class = 'FEATHERWEIGHT'
-    else:
+    index = bisect_right(_WEIGHT_CLASS_THRESHOLDS, weight)
+    if index == 0:
         raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
 
-    return weight_class
+    return _WEIGHT_CLASS_NAMES[index]
 
 
 def update_boxer_stats(boxer_id: int, result: str) -> None:
-    if result not in {'win', 'loss'}:
+    query = _Q_UPDATE_BY_RESULT.get(result)
+    if query is None:
         raise ValueError(f"Invalid result: {result}. Expected 'win' or 'loss'.")
 
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
+            cursor.execute(query, (boxer_id,))
+            if cursor.rowcount == 0:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            if result == 'win':
-                cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
-            else:  # result == 'loss'
-                cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
+            conn.commit()
+            _invalidate_leaderboard()
+
+    except sqlite3.Error as e:
+        raise e
+
+
+def apply_fight_result(winner_id: int, loser_id: int) -> None:
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            # Record both sides of the fight in a single transaction
+            cursor.executemany(_Q_APPLY_FIGHT_RESULT, [(1, winner_id), (0, loser_id)])
+            if cursor.rowcount < 2:
+                raise ValueError(f"Boxer with ID {winner_id} or {loser_id} not found.")
 
             conn.commit()
+            _invalidate_leaderboard()
+
+    except sqlite3.Error as e:
+        raise e
+
+
+def migrate_weight_class() -> None:
+    # Safe to run on every startup: adds the column only if it is missing and
+    # only backfills rows that don't have a weight class yet
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(_Q_TABLE_COLUMNS)
+            columns = {row[1] for row in cursor.fetchall()}
+            if not columns:
+                return  # No boxers table yet; db_check reports that
+
+            if 'weight_class' not in columns:
+                cursor.execute(_Q_ADD_WEIGHT_CLASS)
+
+            cursor.execute(_Q_SELECT_MISSING_WEIGHT_CLASS)
+            updates = [(get_weight_class(weight), boxer_id) for boxer_id, weight in cursor.fetchall()]
+            if updates:
+                cursor.executemany(_Q_SET_WEIGHT_CLASS, updates)
+
+            conn.commit()
+
+            if updates:
+                _invalidate_leaderboard()
 
     except sqlite3.Error as e:
         raise e
@@ -1,8 +1,9 @@
+from functools import lru_cache
 import logging
-import math
+from math import exp
 from typing import List
 
-from boxing.models.boxers_model import Boxer, update_boxer_stats
+from boxing.models.boxers_model import Boxer, apply_fight_result
 from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
 
@@ -11,6 +12,14 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+# Skill only depends on these four inputs, so repeated matchups reuse the score
+@lru_cache(maxsize=1024)
+def _compute_fighting_skill(weight: float, name_length: int, reach: float, age: int) -> float:
+    # Arbitrary calculations
+    age_modifier = -1 if age < 25 else (-2 if age > 35 else 0)
+    return (weight * name_length) + (reach / 10) + age_modifier
+
+
 class RingModel:
     def __init__(self):
         self.ring: List[Boxer] = []
@@ -19,15 +28,16 @@ class RingModel:
         if len(self.ring) < 2:
             raise ValueError("There must be two boxers to start a fight.")
 
-        boxer_1, boxer_2 = self.get_boxers()
+        boxer_1, boxer_2 = self.ring
 
         skill_1 = self.get_fighting_skill(boxer_1)
         skill_2 = self.get_fighting_skill(boxer_2)
 
         # Compute the absolute skill difference
         # And normalize using a logistic function for better probability scaling
+        # Since delta >= 0 the result is always in [0.5, 1.0]; ties skip the exp call
         delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        normalized_delta = 0.5 if delta == 0.0 else 1.0 / (1.0 + exp(-delta))
 
         random_number = get_random()
 
@@ -38,8 +48,7 @@ class RingModel:
             winner = boxer_2
             loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        apply_fight_result(winner.id, loser.id)
 
         self.clear_ring()
 
@@ -51,7 +60,8 @@ class RingModel:
         self.ring.clear()
 
     def enter_ring(self, boxer: Boxer):
-        if not isinstance(boxer, Boxer):
+        # Type check is a development guard only; it is compiled out under python -O
+        if __debug__ and not isinstance(boxer, Boxer):
             raise TypeError(f"Invalid type: Expected 'Boxer', got '{type(boxer).__name__}'")
 
         if len(self.ring) >= 2:
@@ -60,16 +70,8 @@ class RingModel:
         self.ring.append(boxer)
 
     def get_boxers(self) -> List[Boxer]:
-        if not self.ring:
-            pass
-        else:
-            pass
-
         return self.ring
 
-    def get_fighting_skill(self, boxer: Boxer) -> float:
-        # Arbitrary calculations
-        age_modifier = -1 if boxer.age < 25 else (-2 if boxer.age > 35 else 0)
-        skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
-
-        return skill
+    @staticmethod
+    def get_fighting_skill(boxer: Boxer) -> float:
+        return _compute_fighting_skill(boxer.weight, len(boxer.name), boxer.reach, boxer.age)
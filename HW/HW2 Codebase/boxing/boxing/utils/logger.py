@@ -4,11 +4,21 @@ import sys
 from flask import current_app, has_request_context
 
 
+# Name given to the stderr handler so repeated calls don't attach a second copy
+HANDLER_NAME = "boxing.stderr"
+
+
 def configure_logger(logger):
     logger.setLevel(logging.DEBUG)
 
+    # Modules can be re-imported or reloaded (e.g. under pytest); avoid fanning
+    # every record out to duplicate handlers
+    if any(h.get_name() == HANDLER_NAME for h in logger.handlers):
+        return
+
     # Create a console handler that logs to stderr
     handler = logging.StreamHandler(sys.stderr)
+    handler.set_name(HANDLER_NAME)
     handler.setLevel(logging.DEBUG)
 
     # Create a formatter with a timestamp
@@ -1,7 +1,9 @@
 from contextlib import contextmanager
 import logging
 import os
+import queue
 import sqlite3
+import threading
 
 from boxing.utils.logger import configure_logger
 
@@ -13,6 +15,25 @@ configure_logger(logger)
 # load the db path from the environment with a default value
 DB_PATH = os.getenv("DB_PATH", "/app/sql/boxing.db")
 
+# WAL lets readers run alongside the writer, and synchronous=NORMAL is safe in
+# WAL mode while avoiding an fsync on every commit
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+"""
+
+# Connections are opened once and shared between requests instead of
+# reconnecting (and re-reading the schema) on every call
+POOL_SIZE = os.cpu_count() or 1
+# Seconds to wait for a free connection before giving up
+POOL_TIMEOUT = 10.0
+
+_pool = None
+_pool_lock = threading.Lock()
+
 
 def check_database_connection():
     try:
@@ -47,14 +68,49 @@ def check_table_exists(tablename: str):
         error_message = f"Table check error for '{tablename}': {e}"
         raise Exception(error_message) from e
 
+def _create_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.executescript(_CONNECTION_PRAGMAS)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def _get_pool() -> queue.Queue:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # Slots start empty (None) and are connected on first use, so a
+                # slot whose connection had to be discarded is simply refilled later
+                pool = queue.Queue(maxsize=POOL_SIZE)
+                for _ in range(POOL_SIZE):
+                    pool.put(None)
+                _pool = pool
+    return _pool
+
 @contextmanager
 def get_db_connection():
-    conn = None
+    pool = _get_pool()
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = pool.get(timeout=POOL_TIMEOUT)
+    except queue.Empty:
+        raise sqlite3.OperationalError(
+            f"Timed out after {POOL_TIMEOUT} seconds waiting for a database connection"
+        )
+
+    try:
+        if conn is None:
+            conn = _create_connection()
         yield conn
     except sqlite3.Error as e:
         raise e
     finally:
-        if conn:
+        # Never hand a connection with a half-finished transaction to the next caller
+        try:
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
             conn.close()
+            conn = None
+        finally:
+            # Always return the slot, even if it no longer holds a connection
+            pool.put(conn)
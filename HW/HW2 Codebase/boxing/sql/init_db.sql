@@ -6,8 +6,13 @@ CREATE TABLE boxers (
     height REAL NOT NULL CHECK (height > 0),
     reach REAL CHECK (reach > 0),
     age INTEGER NOT NULL CHECK (age >= 18 AND age <= 40),
+    weight_class TEXT,  -- Derived from weight when the boxer is created
     fights INTEGER DEFAULT 0 CHECK (fights >= 0),
     wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights)  -- Wins cannot exceed fights
 );
 
 CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+
+-- Partial indexes covering the two leaderboard orderings (only boxers that have fought are ranked)
+CREATE INDEX idx_boxers_wins ON boxers(wins DESC) WHERE fights > 0;
+CREATE INDEX idx_boxers_win_pct ON boxers((wins * 1.0 / fights) DESC) WHERE fights > 0;
@@ -0,0 +1,38 @@
+import os
+import sqlite3
+
+import pytest
+
+from boxing.utils import sql_utils
+
+
+INIT_DB_SQL = os.path.join(os.path.dirname(__file__), "..", "sql", "init_db.sql")
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """Point the connection pool at a fresh on-disk database built from init_db.sql.
+
+    The pool is shrunk to a single connection with a short timeout so that a
+    leaked slot shows up as an error instead of a hung test.
+
+    """
+    db_path = str(tmp_path / "boxing.db")
+    with open(INIT_DB_SQL) as f:
+        conn = sqlite3.connect(db_path)
+        conn.executescript(f.read())
+        conn.close()
+
+    monkeypatch.setattr(sql_utils, "DB_PATH", db_path)
+    monkeypatch.setattr(sql_utils, "POOL_SIZE", 1)
+    monkeypatch.setattr(sql_utils, "POOL_TIMEOUT", 0.5)
+    monkeypatch.setattr(sql_utils, "_pool", None)
+
+    yield db_path
+
+    # Close whatever the test left in the pool
+    pool = sql_utils._pool
+    while pool is not None and not pool.empty():
+        conn = pool.get_nowait()
+        if conn is not None:
+            conn.close()
@@ -0,0 +1,412 @@
+from contextlib import contextmanager
+import copy
+import dataclasses
+import pickle
+import re
+import sqlite3
+
+import pytest
+
+from boxing.models.boxers_model import (
+    Boxer,
+    _clear_leaderboard_cache,
+    _invalidate_leaderboard,
+    apply_fight_result,
+    create_boxer,
+    delete_boxer,
+    get_leaderboard,
+    migrate_weight_class,
+    update_boxer_stats
+)
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+def normalize_whitespace(sql_query: str) -> str:
+    return re.sub(r'\s+', ' ', sql_query).strip()
+
+# Mocking the database connection for tests
+@pytest.fixture
+def mock_cursor(mocker):
+    mock_conn = mocker.Mock()
+    mock_cursor = mocker.MagicMock()
+
+    # Mock the connection's cursor
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.connection = mock_conn
+    mock_cursor.fetchone.return_value = None  # Default return for queries
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.rowcount = 1
+    mock_cursor.__iter__.side_effect = lambda: iter([])  # Default rows when iterating the cursor
+
+    # Mock the get_db_connection context manager from sql_utils
+    @contextmanager
+    def mock_get_db_connection():
+        yield mock_conn  # Yield the mocked connection object
+
+    mocker.patch("boxing.models.boxers_model.get_db_connection", mock_get_db_connection)
+
+    return mock_cursor  # Return the mock cursor so we can set expectations per test
+
+
+@pytest.fixture(autouse=True)
+def clear_leaderboard_cache():
+    """The leaderboard cache is module-level; don't let results leak between tests.
+
+    """
+    _clear_leaderboard_cache()
+    yield
+    _clear_leaderboard_cache()
+
+
+@pytest.fixture
+def leaderboard_rows():
+    return [
+        {"id": 1, "name": "Muhammad Ali", "weight": 210, "height": 191, "reach": 78.0, "age": 32,
+         "weight_class": "HEAVYWEIGHT", "fights": 4, "wins": 3, "win_pct": 75.0},
+        {"id": 2, "name": "Mike Tyson", "weight": 220, "height": 178, "reach": 71.0, "age": 30,
+         "weight_class": "HEAVYWEIGHT", "fights": 4, "wins": 1, "win_pct": 25.0},
+    ]
+
+
+@pytest.fixture
+def sample_boxer():
+    return Boxer(1, "Mike Tyson", 220, 178, 71.0, 30)
+
+
+######################################################
+#
+#    Boxer
+#
+######################################################
+
+
+def test_boxer_weight_class(sample_boxer):
+    """Test that a boxer's weight class is derived from its weight.
+
+    """
+    assert sample_boxer.weight_class == "HEAVYWEIGHT"
+
+
+def test_boxer_is_frozen(sample_boxer):
+    """Test that a boxer cannot be modified after construction.
+
+    """
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sample_boxer.weight = 150
+
+
+@pytest.mark.parametrize("clone", [
+    copy.copy,
+    copy.deepcopy,
+    lambda boxer: pickle.loads(pickle.dumps(boxer)),
+])
+def test_boxer_copy_and_pickle(sample_boxer, clone):
+    """Test that a boxer survives copying and pickling with all of its fields.
+
+    """
+    result = clone(sample_boxer)
+
+    assert result == sample_boxer, f"Expected {sample_boxer}, got {result}"
+    assert result is not sample_boxer
+    assert result.weight_class == "HEAVYWEIGHT"
+
+
+######################################################
+#
+#    Fight results
+#
+######################################################
+
+
+def test_apply_fight_result(mock_cursor):
+    """Test recording a fight updates both boxers in one executemany and commits once.
+
+    """
+    mock_cursor.rowcount = 2
+
+    apply_fight_result(1, 2)
+
+    expected_query = normalize_whitespace("UPDATE boxers SET fights = fights + 1, wins = wins + ? WHERE id = ?")
+    actual_query = normalize_whitespace(mock_cursor.executemany.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+
+    actual_arguments = mock_cursor.executemany.call_args[0][1]
+    expected_arguments = [(1, 1), (0, 2)]
+
+    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+
+    mock_cursor.execute.assert_not_called()
+    mock_cursor.connection.commit.assert_called_once()
+
+
+def test_apply_fight_result_bad_id(mock_cursor):
+    """Test error when one of the boxers in a fight does not exist.
+
+    """
+    # Only the winner's row was updated
+    mock_cursor.rowcount = 1
+
+    with pytest.raises(ValueError, match="Boxer with ID 1 or 99 not found."):
+        apply_fight_result(1, 99)
+
+    mock_cursor.connection.commit.assert_not_called()
+
+
+def test_apply_fight_result_bad_id_rolls_back(sqlite_db):
+    """Test that a fight with a missing boxer leaves the other boxer's record unchanged.
+
+    """
+    create_boxer("Muhammad Ali", 210, 191, 78, 32)
+
+    with pytest.raises(ValueError, match="Boxer with ID 1 or 99 not found."):
+        apply_fight_result(1, 99)
+
+    conn = sqlite3.connect(sqlite_db)
+    fights, wins = conn.execute("SELECT fights, wins FROM boxers WHERE id = 1").fetchone()
+    conn.close()
+
+    assert (fights, wins) == (0, 0), f"Expected boxer 1 to be unchanged, got fights={fights}, wins={wins}"
+
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+
+def test_get_leaderboard(mock_cursor, leaderboard_rows):
+    """Test getting the leaderboard sorted by wins.
+
+    """
+    mock_cursor.__iter__.side_effect = lambda: iter(leaderboard_rows)
+
+    result = get_leaderboard("wins")
+
+    assert result == leaderboard_rows, f"Expected {leaderboard_rows}, got {result}"
+
+    expected_query = normalize_whitespace("""
+        SELECT id, name, weight, height, reach, age, weight_class, fights, wins,
+               ROUND(wins * 100.0 / fights, 1) AS win_pct
+        FROM boxers
+        WHERE fights > 0
+        ORDER BY wins DESC
+    """)
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_query == expected_query, "The SQL query did not match the expected structure."
+
+
+def test_get_leaderboard_win_pct_rounding(sqlite_db):
+    """Test that win percentages are rounded by SQLite, which rounds halves away from zero.
+
+    """
+    create_boxer("Muhammad Ali", 210, 191, 78, 32)
+
+    conn = sqlite3.connect(sqlite_db)
+    conn.execute("UPDATE boxers SET fights = 16, wins = 1")
+    conn.commit()
+    conn.close()
+
+    assert get_leaderboard()[0]["win_pct"] == 6.3
+
+
+def test_get_leaderboard_win_pct(mock_cursor):
+    """Test that sorting by win percentage orders on the raw ratio.
+
+    """
+    get_leaderboard("win_pct")
+
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+
+    assert actual_query.endswith("ORDER BY (wins * 1.0 / fights) DESC"), "The leaderboard was not ordered by win ratio."
+
+
+def test_get_leaderboard_invalid_sort(mock_cursor):
+    """Test error when getting the leaderboard with an invalid sort parameter.
+
+    """
+    with pytest.raises(ValueError, match="Invalid sort_by parameter: age"):
+        get_leaderboard("age")
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_get_leaderboard_cache_hit(mock_cursor, mocker, leaderboard_rows):
+    """Test that a second call within the TTL is served from the cache.
+
+    """
+    mock_time = mocker.patch("boxing.models.boxers_model.time")
+    mock_time.monotonic.side_effect = [100.0, 104.0]
+    mock_cursor.__iter__.side_effect = lambda: iter(leaderboard_rows)
+
+    first = get_leaderboard()
+    second = get_leaderboard()
+
+    assert first == second == leaderboard_rows
+    assert mock_cursor.execute.call_count == 1, "The cached leaderboard should not be queried again."
+
+
+def test_get_leaderboard_cache_expires(mock_cursor, mocker):
+    """Test that the leaderboard is queried again once the TTL has passed.
+
+    """
+    mock_time = mocker.patch("boxing.models.boxers_model.time")
+    mock_time.monotonic.side_effect = [100.0, 105.0, 105.0]
+
+    get_leaderboard()
+    get_leaderboard()
+
+    assert mock_cursor.execute.call_count == 2, "An expired leaderboard should be queried again."
+
+
+def test_get_leaderboard_cache_per_sort(mock_cursor):
+    """Test that each sort order is cached separately.
+
+    """
+    get_leaderboard("wins")
+    get_leaderboard("win_pct")
+
+    assert mock_cursor.execute.call_count == 2
+
+
+def test_get_leaderboard_returns_copies(mock_cursor, leaderboard_rows):
+    """Test that modifying a returned leaderboard does not change the cached rows.
+
+    """
+    mock_cursor.__iter__.side_effect = lambda: iter([dict(row) for row in leaderboard_rows])
+
+    get_leaderboard()[0]["wins"] = 999
+    result = get_leaderboard()
+
+    assert result[0]["wins"] == 3, f"Expected the cached value 3, got {result[0]['wins']}"
+    assert mock_cursor.execute.call_count == 1
+
+
+@pytest.mark.parametrize("mutation,rowcount", [
+    (lambda: create_boxer("New Boxer", 150, 70, 72.5, 25), 1),
+    (lambda: delete_boxer(1), 1),
+    (lambda: update_boxer_stats(1, "win"), 1),
+    (lambda: apply_fight_result(1, 2), 2),
+])
+def test_get_leaderboard_invalidated_by_mutation(mock_cursor, mutation, rowcount):
+    """Test that every committed write to the boxers table invalidates the cached leaderboard.
+
+    """
+    get_leaderboard()
+
+    mock_cursor.rowcount = rowcount
+    mutation()
+    mock_cursor.execute.reset_mock()
+
+    get_leaderboard()
+
+    assert mock_cursor.execute.call_count == 1, "The leaderboard should be queried again after a write."
+
+
+def test_get_leaderboard_not_invalidated_by_failed_mutation(mock_cursor):
+    """Test that a write that fails before committing leaves the cache in place.
+
+    """
+    get_leaderboard()
+
+    mock_cursor.rowcount = 0
+    with pytest.raises(ValueError, match="Boxer with ID 999 not found."):
+        delete_boxer(999)
+    mock_cursor.execute.reset_mock()
+
+    get_leaderboard()
+
+    mock_cursor.execute.assert_not_called()
+
+
+def test_get_leaderboard_write_during_query(mock_cursor):
+    """Test that a result computed while a write lands is not served from the cache.
+
+    """
+    # Simulate another request committing a fight while the SELECT is running
+    mock_cursor.execute.side_effect = lambda query: _invalidate_leaderboard()
+
+    get_leaderboard()
+    mock_cursor.execute.side_effect = None
+    get_leaderboard()
+
+    assert mock_cursor.execute.call_count == 2, "A result raced by a write should be treated as stale."
+
+
+######################################################
+#
+#    Schema migration
+#
+######################################################
+
+
+LEGACY_BOXERS_TABLE = """
+    DROP TABLE boxers;
+    CREATE TABLE boxers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        weight REAL NOT NULL CHECK (weight > 0),
+        height REAL NOT NULL CHECK (height > 0),
+        reach REAL CHECK (reach > 0),
+        age INTEGER NOT NULL CHECK (age >= 18 AND age <= 40),
+        fights INTEGER DEFAULT 0 CHECK (fights >= 0),
+        wins INTEGER DEFAULT 0 CHECK (wins >= 0 AND wins <= fights)
+    );
+    INSERT INTO boxers (name, weight, height, reach, age, fights, wins) VALUES
+        ('Muhammad Ali', 210, 191, 78, 32, 2, 2),
+        ('Feather Boxer', 130, 165, 65, 22, 2, 0);
+"""
+
+
+def test_migrate_weight_class_legacy_database(sqlite_db):
+    """Test that a database created before weight_class existed is upgraded and backfilled.
+
+    """
+    conn = sqlite3.connect(sqlite_db)
+    conn.executescript(LEGACY_BOXERS_TABLE)
+    conn.close()
+
+    migrate_weight_class()
+
+    assert [(row["name"], row["weight_class"]) for row in get_leaderboard()] == [
+        ("Muhammad Ali", "HEAVYWEIGHT"),
+        ("Feather Boxer", "FEATHERWEIGHT"),
+    ]
+
+    # New boxers can be created against the upgraded table
+    create_boxer("Mike Tyson", 220, 178, 71.0, 30)
+
+
+def test_migrate_weight_class_is_idempotent(sqlite_db):
+    """Test that running the migration on an up-to-date database changes nothing.
+
+    """
+    create_boxer("Muhammad Ali", 210, 191, 78, 32)
+
+    migrate_weight_class()
+    migrate_weight_class()
+
+    conn = sqlite3.connect(sqlite_db)
+    rows = conn.execute("SELECT name, weight_class FROM boxers").fetchall()
+    conn.close()
+
+    assert rows == [("Muhammad Ali", "HEAVYWEIGHT")]
+
+
+def test_migrate_weight_class_missing_table(sqlite_db):
+    """Test that the migration leaves a database without a boxers table alone.
+
+    """
+    conn = sqlite3.connect(sqlite_db)
+    conn.execute("DROP TABLE boxers")
+    conn.close()
+
+    migrate_weight_class()
@@ -0,0 +1,63 @@
+import pytest
+
+from boxing.models.boxers_model import Boxer
+from boxing.models.ring_model import RingModel
+
+
+@pytest.fixture()
+def ring_model():
+    """Fixture to provide a new instance of RingModel for each test."""
+    return RingModel()
+
+@pytest.fixture
+def mock_apply_fight_result(mocker):
+    """Mock the apply_fight_result function for testing purposes."""
+    return mocker.patch("boxing.models.ring_model.apply_fight_result")
+
+"""Fixtures providing sample boxers for the tests."""
+@pytest.fixture
+def sample_boxer1():
+    return Boxer(1, 'Boxer 1', 160, 70, 70.0, 28)
+
+@pytest.fixture
+def sample_boxer2():
+    return Boxer(2, 'Boxer 2', 160, 68, 68.0, 30)
+
+
+##################################################
+# Fight Test Cases
+##################################################
+
+
+@pytest.mark.parametrize("random_number,winner_index", [
+    (0.1, 0),
+    (0.99, 1),
+])
+def test_fight(mocker, ring_model, sample_boxer1, sample_boxer2, mock_apply_fight_result,
+               random_number, winner_index):
+    """Test that a fight records the result for the winner and the loser and clears the ring.
+
+    """
+    mocker.patch("boxing.models.ring_model.get_random", return_value=random_number)
+    boxers = [sample_boxer1, sample_boxer2]
+    winner, loser = boxers[winner_index], boxers[1 - winner_index]
+
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    assert ring_model.fight() == winner.name
+
+    mock_apply_fight_result.assert_called_once_with(winner.id, loser.id)
+    assert ring_model.get_boxers() == [], "Expected the ring to be cleared after the fight."
+
+
+def test_fight_not_enough_boxers(ring_model, sample_boxer1, mock_apply_fight_result):
+    """Test error when starting a fight with fewer than two boxers.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match="There must be two boxers to start a fight."):
+        ring_model.fight()
+
+    mock_apply_fight_result.assert_not_called()
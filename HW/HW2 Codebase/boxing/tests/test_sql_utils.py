@@ -0,0 +1,101 @@
+import sqlite3
+
+import pytest
+
+from boxing.utils import sql_utils
+from boxing.utils.sql_utils import get_db_connection
+
+
+######################################################
+#
+#    Connection pool
+#
+######################################################
+
+
+def test_get_db_connection_reuses_connection(sqlite_db):
+    """Test that a connection is returned to the pool and handed out again.
+
+    """
+    with get_db_connection() as conn:
+        first = conn
+
+    with get_db_connection() as conn:
+        second = conn
+
+    assert first is second, "Expected the pooled connection to be reused."
+
+
+def test_get_db_connection_pragmas(sqlite_db):
+    """Test that pooled connections are opened in WAL mode with sqlite3.Row rows.
+
+    """
+    with get_db_connection() as conn:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert journal_mode == "wal"
+        assert conn.row_factory is sqlite3.Row
+
+
+def test_get_db_connection_rolls_back_open_transaction(sqlite_db):
+    """Test that uncommitted writes are rolled back before the connection is reused.
+
+    """
+    with pytest.raises(ValueError):
+        with get_db_connection() as conn:
+            conn.execute("INSERT INTO boxers (name, weight, height, reach, age) VALUES ('A', 150, 70, 70, 25)")
+            raise ValueError("abort")
+
+    with get_db_connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM boxers").fetchone()[0]
+
+    assert count == 0, "The uncommitted insert should have been rolled back."
+
+
+def test_get_db_connection_timeout(sqlite_db):
+    """Test that waiting on an exhausted pool raises instead of hanging.
+
+    """
+    with get_db_connection():
+        with pytest.raises(sqlite3.OperationalError, match="waiting for a database connection"):
+            with get_db_connection():
+                pass
+
+
+def test_get_db_connection_keeps_slot_after_failed_connect(sqlite_db, monkeypatch):
+    """Test that a connection that cannot be opened does not permanently use up its slot.
+
+    """
+    create_connection = sql_utils._create_connection
+
+    def failing_connection():
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr(sql_utils, "_create_connection", failing_connection)
+    with pytest.raises(sqlite3.OperationalError, match="unable to open database file"):
+        with get_db_connection():
+            pass
+
+    monkeypatch.setattr(sql_utils, "_create_connection", create_connection)
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_get_db_connection_discards_connection_after_failed_rollback(sqlite_db, monkeypatch, mocker):
+    """Test that a connection whose rollback fails is closed and its slot reconnected later.
+
+    """
+    broken_conn = mocker.Mock(in_transaction=True)
+    broken_conn.rollback.side_effect = sqlite3.OperationalError("disk I/O error")
+    monkeypatch.setattr(sql_utils, "_create_connection", lambda: broken_conn)
+
+    with get_db_connection():
+        pass
+
+    broken_conn.close.assert_called_once()
+
+    healthy_conn = mocker.Mock(in_transaction=False)
+    monkeypatch.setattr(sql_utils, "_create_connection", lambda: healthy_conn)
+
+    with get_db_connection() as conn:
+        assert conn is healthy_conn, "Expected the discarded slot to be reconnected."